@@ -17,6 +17,9 @@ Examples:
 
     # Run specific tests in parallel with 4 workers
     python run_tests.py --parallel --workers=4 e2e
+
+    # Run E2E tests with one worker per CPU core
+    python run_tests.py --parallel --workers=auto e2e
 """
 import sys
 import os
@@ -38,7 +41,9 @@ def parse_args():
 
     # Execution options
     parser.add_argument("--parallel", action="store_true", help="Run tests in parallel")
-    parser.add_argument("--workers", type=int, default=2, help="Number of parallel workers (default: 2)")
+    parser.add_argument(
+        "--workers", default="2", help="Number of parallel workers, or 'auto' for one per CPU core (default: 2)"
+    )
     parser.add_argument("--stop", action="store_true", help="Stop on first failure")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
@@ -82,12 +87,20 @@ def run_tests():
 
     # Configure parallel execution if requested
     if args.parallel:
-        pytest_args.extend(["-n", str(args.workers), "--conftest=ww_crm/tests/conftest_parallel.py"])
+        # loadfile keeps each test module on one worker so module-level browser state is reused.
+        # The visual tests are independent page snapshots, so they are spread test by test instead.
+        dist = "load" if (args.category or "").lower() == "visual" else "loadfile"
+        pytest_args.extend(["-n", str(args.workers), f"--dist={dist}", "--conftest=ww_crm/tests/conftest_parallel.py"])
 
     # Handle specific test categories
     if args.category:
         category = args.category.lower()
 
+        # Unit runs load pytest-socket explicitly, so a missing plugin fails the run instead of
+        # leaving the disable_socket marker with nothing to enforce it
+        if category in ("models", "unit"):
+            pytest_args.extend(["-p", "pytest_socket"])
+
         if category == "models":
             pytest_args.append("ww_crm/tests/unit/test_models.py")
         elif category == "routes":
@@ -15,13 +15,14 @@ def configure_db(app: Flask):
         app: The Flask application instance
 
     This function sets up the SQLAlchemy database URI and initializes
-    the database with the application.
+    the database with the application. A URI already set in the app config
+    (e.g. by the test configuration) takes precedence over the default file.
     """
     # Get the path to the database file
     db_path = os.path.join(os.path.dirname(__file__), "database.sqlite")
 
     # Configure database
-    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    app.config.setdefault("SQLALCHEMY_DATABASE_URI", f"sqlite:///{db_path}")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
     # Initialize database with app
@@ -37,6 +37,9 @@ class Customer(db.Model):
     last_invoice_description = db.Column(db.Text)
     last_invoice_id = db.Column(db.Integer)
 
+    # Relationship
+    invoices = db.relationship("Invoice", back_populates="customer")
+
     def __repr__(self):
         """String representation of the Customer object."""
         return f"<Customer {self.id}: {self.name}>"
@@ -116,7 +119,10 @@ class Invoice(db.Model):
     service_description = db.Column(db.Text)
 
     # Relationship
-    customer = db.relationship("Customer", backref="invoices")
+    customer = db.relationship("Customer", back_populates="invoices")
+
+    # Serves the "latest invoice for a customer" lookups behind the last_invoice_* fields
+    __table_args__ = (db.Index("ix_invoice_customer_service_date", "customer_id", "service_date"),)
 
     def __repr__(self):
         """String representation of the Invoice object."""
@@ -135,19 +141,8 @@ class Invoice(db.Model):
             Invoice instance (not yet added to session)
         """
         # Parse dates based on the source format
-        service_date = None
-        if data.get("service_date"):
-            if is_form:
-                service_date = datetime.strptime(data.get("service_date"), "%Y-%m-%d")
-            else:
-                service_date = datetime.fromisoformat(data.get("service_date"))
-
-        due_date = None
-        if data.get("due_date"):
-            if is_form:
-                due_date = datetime.strptime(data.get("due_date"), "%Y-%m-%d")
-            else:
-                due_date = datetime.fromisoformat(data.get("due_date"))
+        service_date = cls._parse_date(data.get("service_date"), is_form)
+        due_date = cls._parse_date(data.get("due_date"), is_form)
 
         # Handle amount type conversion for form data
         amount = data.get("amount")
@@ -164,6 +159,30 @@ class Invoice(db.Model):
             service_description=data.get("service_description"),
         )
 
+    @staticmethod
+    def _parse_date(value, is_form=False):
+        """
+        Parse a date string from JSON (ISO 8601) or a form ("YYYY-MM-DD").
+
+        fromisoformat (much faster than strptime) covers both formats; strptime
+        remains as a fallback for unpadded form dates like "2024-5-1".
+
+        Args:
+            value: The date string, or None/empty for no date
+            is_form: Whether the value is from a form
+
+        Returns:
+            datetime or None
+        """
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            if not is_form:
+                raise
+            return datetime.strptime(value, "%Y-%m-%d")
+
     def to_dict(self):
         """
         Convert invoice to dictionary for API responses.
@@ -34,17 +34,17 @@ def list_customers():
 def create_customer():
     """Create a new customer."""
     if request.method == "POST":
-        # Get data from either JSON or form
-        is_json = request.headers.get("Accept") == "application/json" or request.content_type == "application/json"
+        # Get data from either JSON or form, based on the request body's content type
+        is_json = request.is_json
         data = request.get_json() if is_json else request.form
         
         # Create customer
         customer = CustomerService.create_customer(data, not is_json)
         
-        # Return appropriate response
+        # Return appropriate response (JSON or a redirect, negotiated by created_response)
         return created_response(
             customer.to_dict(),
-            redirect_endpoint="customers.list_customers" if not is_json else None
+            redirect_endpoint="customers.list_customers"
         )
 
     # Get business settings
@@ -7,7 +7,7 @@ from ww_crm.models import Customer
 from ww_crm.services.invoice_service import InvoiceService
 from ww_crm.services.customer_service import CustomerService
 from ww_crm.services.business_config_service import BusinessConfigService
-from ww_crm.utils.response import render_response, created_response, no_content_response
+from ww_crm.utils.response import render_response, created_response, no_content_response, is_json_request
 from ww_crm.utils.constants import InvoiceStatus
 
 # Create blueprint for invoice routes
@@ -35,8 +35,8 @@ def list_invoices():
 def create_invoice():
     """Create a new invoice."""
     if request.method == "POST":
-        # Get data from either JSON or form
-        is_json = request.headers.get("Accept") == "application/json" or request.content_type == "application/json"
+        # Get data from either JSON or form, based on the request body's content type
+        is_json = request.is_json
         data = request.get_json() if is_json else request.form
 
         # Create invoice
@@ -47,7 +47,7 @@ def create_invoice():
         json_data["customer_name"] = invoice.customer.name
         
         # Return appropriate response
-        if is_json:
+        if is_json_request():
             return created_response(json_data)
         else:
             # For form submissions, redirect to the invoice view page
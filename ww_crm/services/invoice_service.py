@@ -3,6 +3,7 @@ Service layer for invoice-related business logic.
 """
 
 from flask import abort
+from sqlalchemy.orm import selectinload
 from ww_crm.db import db
 from ww_crm.models import Invoice, Customer
 from ww_crm.services.customer_service import CustomerService
@@ -16,11 +17,14 @@ class InvoiceService:
     def get_all_invoices():
         """
         Get all invoices from the database.
+
+        Each invoice's customer is loaded up front with one extra IN query,
+        since the invoice list shows every customer's name.
         
         Returns:
             list: List of Invoice objects
         """
-        return Invoice.query.all()
+        return Invoice.query.options(selectinload(Invoice.customer)).all()
     
     @staticmethod
     def get_invoice_by_id(invoice_id):
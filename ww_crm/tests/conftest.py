@@ -4,7 +4,9 @@ Pytest configuration and fixtures for Window Wash CRM tests.
 
 import os
 import tempfile
+from contextlib import contextmanager
 import pytest
+from sqlalchemy import event
 from ww_crm.app import create_app
 from ww_crm.db import db as _db
 from ww_crm.models import Customer, Invoice
@@ -22,8 +24,9 @@ def app():
     # Create a test configuration
     test_config = {"TESTING": True, "WTF_CSRF_ENABLED": False, "DEBUG": False}
 
-    # Set up the test database
-    db_fd, db_path = tempfile.mkstemp()
+    # Set up the test database; each xdist worker gets its own file
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    db_fd, db_path = tempfile.mkstemp(prefix=f"ww_crm_test_{worker_id}_", suffix=".sqlite")
     test_config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
 
     # Create the app with test configuration
@@ -31,6 +34,16 @@ def app():
 
     # Create the database and application context
     with flask_app.app_context():
+        # pysqlite neither emits BEGIN itself nor supports SAVEPOINT without it, so let
+        # SQLAlchemy start transactions; the db fixture relies on savepoints
+        @event.listens_for(_db.engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(_db.engine, "begin")
+        def _emit_begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
         _db.create_all()
         yield flask_app
 
@@ -40,18 +53,41 @@ def app():
 
 
 @pytest.fixture(scope="function")
-def db(app):
+def db(app, request):
     """
-    Create a fresh database for each test.
-    This is a function-scoped fixture, so it's destroyed after each test.
+    Provide empty tables for each test.
+    The schema is created once per session by the app fixture. Each test runs inside
+    an outer transaction that is rolled back afterwards. The session works in a
+    SAVEPOINT within it, so commits made during the test (by factories or the app)
+    and rollbacks after errors both stay inside the outer transaction.
+
+    Tests using the live server can't work that way, since the server process only
+    sees committed rows. Their data is committed as usual and the tables are emptied
+    after the test instead.
     """
     with app.app_context():
-        _db.drop_all()  # Drop all tables first
-        _db.create_all()  # Recreate all tables
+        if "live_server" in request.fixturenames:
+            yield _db
+            _db.session.rollback()  # Ensure any failed transactions are rolled back
+            for table in reversed(_db.metadata.sorted_tables):  # Children before parents
+                _db.session.execute(table.delete())
+            _db.session.commit()
+            _db.session.remove()
+            return
+
+        connection = _db.engine.connect()
+        transaction = connection.begin()
+        # Flask-SQLAlchemy's session picks its bind from db.engines, so point the default
+        # bind at the test connection for the duration of the test
+        engines = _db.engines
+        engine = engines[None]
+        engines[None] = connection
+        _db.session.registry.set(_db.session.session_factory(join_transaction_mode="create_savepoint"))
         yield _db
-        _db.session.rollback()  # Ensure any failed transactions are rolled back
         _db.session.remove()
-        _db.drop_all()
+        engines[None] = engine
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -88,6 +124,38 @@ def seeded_db(db):
     return seed_test_data(num_customers=3, invoices_per_customer=2)
 
 
+@pytest.fixture(scope="function")
+def assert_max_queries(db):
+    """
+    Return a context manager that fails the test if its block runs more than `limit` SQL statements.
+
+    Usage:
+        with assert_max_queries(2):
+            invoices = InvoiceService.get_all_invoices()
+
+    The list of executed statements is yielded for inspection.
+    """
+
+    @contextmanager
+    def _assert_max_queries(limit):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            # The db fixture's savepoints are test scaffolding, not queries
+            if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        executed = "\n".join(statements)
+        assert len(statements) <= limit, f"Expected at most {limit} queries, ran {len(statements)}:\n{executed}"
+
+    return _assert_max_queries
+
+
 # --------------------------------
 # UI Test Fixtures
 # --------------------------------
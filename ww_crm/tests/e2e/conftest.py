@@ -0,0 +1,155 @@
+"""
+Pytest configuration for the E2E tests.
+
+When running under pytest-xdist, each worker writes the e2e loggers to its own
+file through a QueueHandler, so workers never contend on a shared stderr lock.
+
+The e2e loggers default to WARNING so page-object debug chatter (and the DOM
+queries that only feed it) is skipped in CI. Pass -vv or --log-level to see it.
+
+The browser context and page are shared by all tests in a module, so each
+module opens one context on the session browser instead of one per test.
+Tests must navigate to the page they need rather than assume a fresh tab.
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import re
+from functools import cached_property
+from pathlib import Path
+
+import factory
+import pytest
+
+from ww_crm.tests.e2e.pages.home_page import HomePage
+from ww_crm.tests.e2e.pages.customer_list_page import CustomerListPage
+from ww_crm.tests.e2e.pages.customer_create_page import CustomerCreatePage
+from ww_crm.tests.e2e.pages.invoice_list_page import InvoiceListPage
+from ww_crm.tests.fixtures import CustomerFactory
+
+E2E_LOGGER_NAME = "ww_crm.tests.e2e"
+LOG_DIR = Path(__file__).resolve().parents[3] / "logs"
+
+_log_listener = None
+
+# Customer variants for parameterized tests: test id -> the fields that define the variant.
+# Everything else is generated by CustomerFactory when a test asks for the variant.
+CUSTOMER_VARIANTS = {
+    "residential_small": {"service_units": 10, "notes": "Regular residential customer with few windows"},
+    "residential_large": {"service_units": 30, "notes": "Large residential with many windows"},
+    "commercial": {"service_units": 50, "notes": "Office building with many windows"},
+}
+
+
+def pytest_configure(config):
+    """Set the e2e log level and route e2e logging to a per-worker file when running under xdist."""
+    global _log_listener
+    if config.getoption("verbose") < 2 and not config.getoption("log_level"):
+        logging.getLogger(E2E_LOGGER_NAME).setLevel(logging.WARNING)
+
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker_id:
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+    file_handler = logging.FileHandler(LOG_DIR / f"e2e-{worker_id}.log")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue = queue.Queue(-1)
+    e2e_logger = logging.getLogger(E2E_LOGGER_NAME)
+    e2e_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    e2e_logger.propagate = False
+
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+
+
+def pytest_unconfigure(config):
+    """Flush and stop the per-worker log listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+@pytest.fixture(scope="module")
+def context(browser, browser_context_args):
+    """One browser context per test module, replacing pytest-playwright's per-test context."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def page(context):
+    """One page per test module, reused by every test in it."""
+    return context.new_page()
+
+
+class PageObjects:
+    """Lazily built page objects bound to one page; only the pages a test touches are constructed."""
+
+    def __init__(self, page, base_url):
+        self.page = page
+        self.base_url = base_url
+
+    @cached_property
+    def home_page(self):
+        return HomePage(self.page, self.base_url)
+
+    @cached_property
+    def customer_list_page(self):
+        return CustomerListPage(self.page, self.base_url)
+
+    @cached_property
+    def customer_create_page(self):
+        return CustomerCreatePage(self.page, self.base_url)
+
+    @cached_property
+    def invoice_list_page(self):
+        return InvoiceListPage(self.page, self.base_url)
+
+
+@pytest.fixture(scope="session")
+def base_url(live_server):
+    """
+    The live server's URL, resolved once per session.
+
+    Overrides pytest-base-url's fixture, so browser contexts also get it as
+    their base_url and page.goto("/customers") works without a host.
+    """
+    return live_server.url()
+
+
+@pytest.fixture(scope="module")
+def pages(page, base_url):
+    """Page objects shared by every test in a module, alongside the module's page."""
+    return PageObjects(page, base_url)
+
+
+@pytest.fixture(autouse=True)
+def screenshot_on_failure(request, pytestconfig):
+    """
+    Save a screenshot of the shared page when a test fails.
+
+    pytest-playwright only does this from its own function-scoped context
+    fixture, which the module-scoped override above replaces.
+    """
+    yield
+    if pytestconfig.getoption("--screenshot") != "only-on-failure" or "page" not in request.fixturenames:
+        return
+    report = getattr(request.node, "rep_call", None)
+    if report is None or not report.failed:
+        return
+    test_dir = Path(pytestconfig.getoption("--output")) / re.sub(r"[^\w.-]+", "-", request.node.nodeid)
+    test_dir.mkdir(parents=True, exist_ok=True)
+    request.getfixturevalue("page").screenshot(path=str(test_dir / "test-failed-1.png"))
+
+
+@pytest.fixture(params=list(CUSTOMER_VARIANTS))
+def customer_data(request):
+    """Customer form data, built on demand; tests using this fixture run once per CUSTOMER_VARIANTS entry."""
+    data = factory.build(dict, FACTORY_CLASS=CustomerFactory, **CUSTOMER_VARIANTS[request.param])
+    return {field: data[field] for field, _ in CustomerCreatePage.FIELD_MAPPING}
@@ -6,12 +6,65 @@ following SOLID principles to create maintainable and extensible test code.
 """
 
 import logging
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeoutError
 from .selectors import NavigationSelectors
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Selectors that may hold form validation or error messages after a submission
+ERROR_SELECTORS = (
+    ".error-message",
+    ".field-error",
+    ".validation-error",
+    ".alert",
+    ".form-error",
+    "#error-message",
+)
+ERROR_SELECTORS_COMPOUND = ", ".join(ERROR_SELECTORS)
+
+# Field validation errors are deterministic, so a form showing them is not worth resubmitting
+VALIDATION_ERROR_SELECTORS = ".error-message, .field-error, .validation-error"
+
+# Fills [selector, value, kind] entries under an optional root and returns a list of problems found
+FILL_FIELDS_SCRIPT = """
+([rootSelector, fields]) => {
+    const problems = [];
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    if (!root) {
+        return [`Form root ${rootSelector} not found - cannot fill`];
+    }
+    for (const [selector, value, kind] of fields) {
+        const el = root.querySelector(selector);
+        if (!el) {
+            problems.push(`Element ${selector} not found - cannot fill`);
+            continue;
+        }
+        if (kind === "check") {
+            el.checked = value;
+        } else if (el.tagName === "SELECT") {
+            const options = Array.from(el.options).map(o => o.value);
+            if (!options.includes(String(value))) {
+                problems.push(`Option value '${value}' not found in ${selector} options: ${options}`);
+                continue;
+            }
+            el.value = String(value);
+        } else {
+            el.value = String(value);
+        }
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+    return problems;
+}
+"""
+
+# How long to wait for a form to be attached before treating it as missing
+FORM_PRESENCE_TIMEOUT_MS = 500
+
+# Base delay between form submission retries, doubled on each attempt
+RETRY_BACKOFF_MS = 200
+
 
 class BasePage:
     """
@@ -31,17 +84,34 @@ class BasePage:
         """
         self.page = page
         self.base_url = base_url
+        self._locators = {}
+
+    def _locator(self, selector: str):
+        """
+        Return the Locator for a selector, creating it only on first use.
+
+        Locators resolve lazily, so one instance stays valid across navigations
+        and is reused by every later call with the same selector.
+        """
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
 
-    def navigate_to(self, path: str = ""):
+    def navigate_to(self, path: str = "", wait_until: str = "commit"):
         """
         Navigate to a specific path in the application.
 
+        By default this returns once the navigation commits; later locator actions
+        and expect() assertions auto-wait for the elements they need.
+
         Args:
             path: The path to navigate to relative to the base URL
+            wait_until: Playwright load state to wait for before returning
         """
         url = f"{self.base_url}{path}"
-        logger.info(f"Navigating to: {url}")
-        self.page.goto(url)
+        logger.info("Navigating to: %s", url)
+        self.page.goto(url, wait_until=wait_until)
 
     def assert_url(self, expected_path: str):
         """
@@ -51,7 +121,7 @@ class BasePage:
             expected_path: The expected path (without the base URL)
         """
         expected_url = f"{self.base_url}{expected_path}"
-        logger.debug(f"Asserting URL is: {expected_url}")
+        logger.debug("Asserting URL is: %s", expected_url)
         expect(self.page).to_have_url(expected_url)
 
     def assert_element_visible(self, selector: str, description: str = None):
@@ -63,11 +133,11 @@ class BasePage:
             description: Optional human-readable description of the element
         """
         desc = description or selector
-        logger.debug(f"Checking visibility of element: {desc}")
+        logger.debug("Checking visibility of element: %s", desc)
         try:
-            expect(self.page.locator(selector)).to_be_visible()
+            expect(self._locator(selector)).to_be_visible()
         except Exception as e:
-            logger.error(f"Element not visible: {desc} (selector: {selector})")
+            logger.error("Element not visible: %s (selector: %s)", desc, selector)
             raise AssertionError(f"Expected element '{desc}' to be visible") from e
 
     def assert_element_contains_text(self, selector: str, expected_text: str, description: str = None):
@@ -80,12 +150,12 @@ class BasePage:
             description: Optional human-readable description of the element
         """
         desc = description or selector
-        logger.debug(f"Checking text content of element: {desc}")
+        logger.debug("Checking text content of element: %s", desc)
         try:
-            expect(self.page.locator(selector)).to_contain_text(expected_text)
+            expect(self._locator(selector)).to_contain_text(expected_text)
         except Exception as e:
-            logger.error(f"Element text mismatch: {desc} (selector: {selector})")
-            logger.error(f"Expected to contain: '{expected_text}', got: '{self.page.locator(selector).text_content()}'")
+            logger.error("Element text mismatch: %s (selector: %s)", desc, selector)
+            logger.error("Expected to contain: %r; assertion detail: %s", expected_text, e)
             raise AssertionError(f"Expected element '{desc}' to contain text '{expected_text}'") from e
 
     def click_element(self, selector: str, description: str = None):
@@ -97,11 +167,11 @@ class BasePage:
             description: Optional human-readable description of the element
         """
         desc = description or selector
-        logger.debug(f"Clicking element: {desc}")
+        logger.debug("Clicking element: %s", desc)
         try:
-            self.page.locator(selector).click()
+            self._locator(selector).click()
         except Exception as e:
-            logger.error(f"Failed to click element: {desc} (selector: {selector})")
+            logger.error("Failed to click element: %s (selector: %s)", desc, selector)
             raise AssertionError(f"Failed to click element '{desc}'") from e
 
     def fill_input(self, selector: str, value: str, description: str = None):
@@ -114,11 +184,11 @@ class BasePage:
             description: Optional human-readable description of the input
         """
         desc = description or selector
-        logger.debug(f"Filling input {desc} with value: {value}")
+        logger.debug("Filling input %s with value: %s", desc, value)
         try:
-            self.page.fill(selector, str(value))
+            self._locator(selector).fill(str(value))
         except Exception as e:
-            logger.error(f"Failed to fill input: {desc} (selector: {selector})")
+            logger.error("Failed to fill input: %s (selector: %s)", desc, selector)
             raise AssertionError(f"Failed to fill input '{desc}'") from e
 
     def select_option(self, selector: str, value: str, description: str = None):
@@ -131,11 +201,11 @@ class BasePage:
             description: Optional human-readable description of the dropdown
         """
         desc = description or selector
-        logger.debug(f"Selecting option {value} from {desc}")
+        logger.debug("Selecting option %s from %s", value, desc)
         try:
-            self.page.select_option(selector, value)
+            self._locator(selector).select_option(value)
         except Exception as e:
-            logger.error(f"Failed to select option: {value} from {desc} (selector: {selector})")
+            logger.error("Failed to select option: %s from %s (selector: %s)", value, desc, selector)
             raise AssertionError(f"Failed to select option '{value}' from '{desc}'") from e
 
 
@@ -160,12 +230,24 @@ class NavigablePage(BasePage):
         """Click the Invoices navigation link."""
         self.click_element(NavigationSelectors.NAV_INVOICES, "Invoices navigation link")
 
+    # Matches each required navigation link only while it is visible
+    VISIBLE_NAV_LINKS = ", ".join(
+        f"{selector}:visible"
+        for selector in (
+            NavigationSelectors.NAV_HOME,
+            NavigationSelectors.NAV_CUSTOMERS,
+            NavigationSelectors.NAV_INVOICES,
+        )
+    )
+
     def assert_navigation_visible(self):
-        """Assert that the main navigation is visible."""
+        """Assert that the main navigation and its Home, Customers and Invoices links are visible."""
         self.assert_element_visible(NavigationSelectors.MAIN_NAV, "Main navigation")
-        self.assert_element_visible(NavigationSelectors.NAV_HOME, "Home navigation link")
-        self.assert_element_visible(NavigationSelectors.NAV_CUSTOMERS, "Customers navigation link")
-        self.assert_element_visible(NavigationSelectors.NAV_INVOICES, "Invoices navigation link")
+        try:
+            expect(self._locator(self.VISIBLE_NAV_LINKS)).to_have_count(3)
+        except Exception as e:
+            logger.error("Navigation links not visible (selector: %s)", self.VISIBLE_NAV_LINKS)
+            raise AssertionError("Expected Home, Customers and Invoices navigation links to be visible") from e
 
 
 class FormPage(BasePage):
@@ -197,231 +279,104 @@ class FormPage(BasePage):
             bool: True if submission and expected navigation succeeded
         """
         try:
-            logger.info(f"DEBUG: Inside submit_form method. Form: {form_selector}, Button: {submit_button_selector}")
-            form = self.page.locator(form_selector)
+            logger.debug("Submitting form %s with button %s", form_selector, submit_button_selector)
+            form = self._locator(form_selector)
 
-            # Make sure form exists
-            if form.count() == 0:
-                logger.error(f"DEBUG: Form not found: {form_selector}")
+            # Make sure the form exists; this returns on the first attached match
+            try:
+                form.first.wait_for(state="attached", timeout=FORM_PRESENCE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                logger.error("Form not found: %s", form_selector)
                 return False
 
-            logger.info(f"DEBUG: Form found. Count: {form.count()}")
-
             # Log the form method and action
-            form_method = form.evaluate("form => form.method")
-            form_action = form.evaluate("form => form.action")
-            logger.info(f"DEBUG: Form method: {form_method}, Form action: {form_action}")
+            if logger.isEnabledFor(logging.DEBUG):
+                form_method = form.evaluate("form => form.method")
+                form_action = form.evaluate("form => form.action")
+                logger.debug("Form method: %s, Form action: %s", form_method, form_action)
 
-            # Use context manager to watch for navigation
+            # Submit and wait for the redirect when one is expected
             if expected_redirect:
                 expected_url = f"{self.base_url}{expected_redirect}"
-                logger.debug(f"DEBUG: Expecting navigation to: {expected_url}")
-                logger.debug(f"DEBUG: Current URL before submit: {self.page.url}")
+                logger.debug("Expecting navigation from %s to %s", self.page.url, expected_url)
 
-                # Try a more robust approach by using JavaScript to submit the form
-                try:
-                    # Set longer timeout for navigation
-                    with self.page.expect_navigation(timeout=timeout) as navigation_info:
-                        if submit_button_selector:
-                            # Try multiple approaches to handle the submit button
-                            try:
-                                logger.info(f"DEBUG: Attempting to click submit button: {submit_button_selector}")
-                                submit_button = self.page.locator(submit_button_selector)
-
-                                if submit_button.count() > 0:
-                                    logger.info(f"DEBUG: Submit button found. Count: {submit_button.count()}")
-
-                                    # First try clicking it directly
-                                    logger.info(f"DEBUG: Clicking submit button via Playwright click")
-                                    submit_button.click(timeout=5000)
-                                else:
-                                    logger.warning(f"DEBUG: Submit button not found: {submit_button_selector}")
-                                    # If button not found, try form submission directly
-                                    logger.info(f"DEBUG: Using JavaScript to submit form")
-                                    form.evaluate("form => { console.log('Submitting form via JS'); form.submit(); }")
-                            except Exception as e:
-                                logger.warning(
-                                    f"DEBUG: Failed to click submit button: {str(e)}. Trying JavaScript form submission."
-                                )
-                                # Different approach with more logging
-                                js_result = self.page.evaluate(
-                                    f"""() => {{
-                                    const form = document.querySelector('{form_selector}');
-                                    if (!form) {{ return "Form not found"; }}
-                                    console.log('Form found in JS, submitting...');
-                                    form.submit();
-                                    return "Form submitted via JS";
-                                }}"""
-                                )
-                                logger.info(f"DEBUG: JavaScript submit result: {js_result}")
-                        else:
-                            logger.info(f"DEBUG: No submit button provided, submitting form via JavaScript")
-                            form.evaluate("form => form.submit()")
-
-                    # After form submission, check navigation
-                    logger.info(f"DEBUG: Navigation attempt completed")
-                    if navigation_info.value:
-                        actual_url = navigation_info.value.url
-                        logger.info(f"DEBUG: Navigated to: {actual_url}")
-
-                        if actual_url == expected_url:
-                            logger.info(f"DEBUG: Successfully navigated to expected URL: {expected_url}")
-                            return True
-                        else:
-                            logger.warning(
-                                f"DEBUG: Navigation occurred but to wrong URL. Expected: {expected_url}, Got: {actual_url}"
-                            )
-                    else:
-                        logger.warning(f"DEBUG: No navigation occurred")
-
-                except Exception as navigation_error:
-                    logger.error(f"DEBUG: Navigation error: {str(navigation_error)}")
-
-                # Check current URL in case navigation happened but we missed it
-                actual_url = self.page.url
-                logger.info(f"DEBUG: Current URL after submit attempt: {actual_url}")
-
-                if actual_url == expected_url:
-                    logger.info(f"DEBUG: URL matches expected - we're on the right page: {expected_url}")
-                    return True
-                else:
-                    logger.warning(f"DEBUG: URLs don't match. Expected: {expected_url}, Got: {actual_url}")
-
-                    # Check for form validation errors with various possible selectors
-                    error_selectors = [
-                        ".error-message",
-                        ".field-error",
-                        ".validation-error",
-                        ".alert",
-                        ".form-error",
-                        "#error-message",
-                    ]
-
-                    for selector in error_selectors:
-                        validation_errors = self.page.locator(selector).all()
-                        if validation_errors:
-                            logger.warning(f"DEBUG: Found {len(validation_errors)} errors with selector '{selector}':")
-                            for error in validation_errors:
-                                logger.warning(f"DEBUG: - {error.text_content()}")
-
-                    # Check HTML response for clues
+                if submit_button_selector:
                     try:
-                        page_html = self.page.content()
-                        if "error" in page_html.lower():
-                            logger.warning("DEBUG: Found 'error' in page HTML content")
+                        # Click auto-waits for the button and raises if it never appears
+                        self._locator(submit_button_selector).click(timeout=5000)
                     except Exception as e:
-                        logger.error(f"DEBUG: Error checking page content: {str(e)}")
+                        logger.error("Failed to click submit button: %s", e)
+                        return False
+                else:
+                    # requestSubmit runs validation and submit handlers, unlike form.submit()
+                    logger.debug("No submit button provided, requesting form submission")
+                    form.evaluate("form => form.requestSubmit()")
+
+                # The URL changes as soon as the redirect commits, so there's no need to wait for load
+                try:
+                    expect(self.page).to_have_url(expected_url, timeout=timeout)
+                    logger.debug("Successfully navigated to expected URL: %s", expected_url)
+                    return True
+                except AssertionError as navigation_error:
+                    logger.error("Navigation error: %s", navigation_error)
+
+                logger.warning("URLs don't match. Expected: %s, Got: %s", expected_url, self.page.url)
 
-                    return False
+                # Check for form validation errors with various possible selectors
+                if logger.isEnabledFor(logging.WARNING):
+                    for error_text in self._locator(ERROR_SELECTORS_COMPOUND).all_text_contents():
+                        logger.warning("- %s", error_text)
+
+                # Check HTML response for clues
+                try:
+                    page_html = self.page.content()
+                    if "error" in page_html.lower():
+                        logger.warning("Found 'error' in page HTML content")
+                except Exception as e:
+                    logger.error("Error checking page content: %s", e)
+
+                return False
             else:
                 # No navigation expectation, just submit the form
-                logger.info("DEBUG: No expected redirect, just submitting form")
+                logger.debug("No expected redirect, just submitting form")
                 if submit_button_selector:
                     try:
                         self.click_element(submit_button_selector, "Form submit button")
-                        logger.info("DEBUG: Clicked submit button without navigation expectation")
                     except Exception as e:
-                        logger.warning(f"DEBUG: Failed to click submit button: {e}. Trying direct form submission.")
-                        result = form.evaluate("form => { form.submit(); return 'Submitted'; }")
-                        logger.info(f"DEBUG: Form submission result: {result}")
+                        logger.error("Failed to click submit button: %s", e)
+                        return False
                 else:
-                    result = form.evaluate("form => { form.submit(); return 'Submitted'; }")
-                    logger.info(f"DEBUG: Direct form submission result: {result}")
+                    form.evaluate("form => form.requestSubmit()")
+                    logger.debug("Requested form submission")
                 return True
 
         except Exception as e:
-            logger.error(f"DEBUG: Form submission failed with exception: {str(e)}")
+            logger.error("Form submission failed with exception: %s", e)
             return False
 
-    def fill_form_fields(self, field_data: dict):
+    def fill_form_fields(self, field_data: dict, root_selector: str = None):
         """
-        Fill multiple form fields at once.
+        Fill multiple form fields at once in a single browser round-trip.
+
+        Checkboxes are toggled for boolean values, select elements get their value set
+        when the option exists, and every other element is filled as text. Each field
+        fires input and change events so page scripts see the update.
 
         Args:
             field_data: Dictionary mapping CSS selectors to values
+            root_selector: Optional selector of the form containing the fields; the root is
+                           resolved once and field selectors are looked up relative to it
         """
-        logger.info(f"DEBUG: Starting to fill {len(field_data)} form fields")
-
-        for selector, value in field_data.items():
-            try:
-                logger.info(f"DEBUG: Filling field {selector} with value: {value}")
-
-                # Check if the element exists before attempting to fill
-                element = self.page.locator(selector)
-                if element.count() == 0:
-                    logger.error(f"DEBUG: Element {selector} not found - cannot fill")
-                    continue
-
-                # Log element details
-                tag_name = element.evaluate("el => el.tagName.toLowerCase()")
-                element_type = element.get_attribute("type") if tag_name == "input" else tag_name
-                logger.info(
-                    f"DEBUG: Element {selector} is a {tag_name}{' of type ' + element_type if element_type and tag_name == 'input' else ''}"
-                )
-
-                # Handle different element types
-                if isinstance(value, bool):
-                    if value:
-                        logger.info(f"DEBUG: Checking checkbox {selector}")
-                        self.page.check(selector)
-                    else:
-                        logger.info(f"DEBUG: Unchecking checkbox {selector}")
-                        self.page.uncheck(selector)
-                elif self.is_select_element(selector):
-                    logger.info(f"DEBUG: Selecting option {value} from dropdown {selector}")
-                    # Check if option exists in the select
-                    options = element.evaluate("el => Array.from(el.options).map(o => o.value)")
-                    logger.info(f"DEBUG: Available options for {selector}: {options}")
-
-                    if str(value) in options:
-                        self.select_option(selector, str(value))
-                    else:
-                        logger.error(f"DEBUG: Option value '{value}' not found in select element options")
-                else:
-                    logger.info(f"DEBUG: Filling input {selector} with text: {value}")
-                    self.fill_input(selector, str(value))
-
-                # Verify the value was set correctly
-                try:
-                    actual_value = None
-                    if tag_name == "select":
-                        actual_value = element.evaluate("el => el.value")
-                    elif tag_name == "input" and element_type == "checkbox":
-                        actual_value = element.is_checked()
-                    else:
-                        actual_value = element.input_value()
-
-                    logger.info(f"DEBUG: After filling, field {selector} has value: {actual_value}")
-
-                    if str(actual_value) != str(value) and not (isinstance(value, bool) and actual_value == value):
-                        logger.warning(
-                            f"DEBUG: Field value mismatch for {selector}. Expected: {value}, Actual: {actual_value}"
-                        )
-                except Exception as verify_error:
-                    logger.error(f"DEBUG: Error verifying field value: {str(verify_error)}")
-
-            except Exception as e:
-                logger.error(f"DEBUG: Error filling field {selector}: {str(e)}")
-
-        logger.info("DEBUG: Finished filling form fields")
-
-    def is_select_element(self, selector: str):
-        """
-        Check if the element is a select element.
+        logger.debug("Starting to fill %d form fields", len(field_data))
 
-        Args:
-            selector: The CSS selector for the element
+        payload = [
+            [selector, value, "check" if isinstance(value, bool) else "fill"] for selector, value in field_data.items()
+        ]
+        problems = self.page.evaluate(FILL_FIELDS_SCRIPT, [root_selector, payload])
+        for problem in problems:
+            logger.error("%s", problem)
 
-        Returns:
-            bool: True if the element is a select element, False otherwise
-        """
-        try:
-            # Get the tag name of the element
-            tag_name = self.page.locator(selector).evaluate("el => el.tagName.toLowerCase()")
-            return tag_name == "select"
-        except Exception:
-            # If there's an error, fall back to checking the selector name
-            return "select" in selector.lower()
+        logger.debug("Finished filling form fields")
 
     def submit_form_with_retry(
         self,
@@ -442,95 +397,83 @@ class FormPage(BasePage):
         Returns:
             bool: True if submission and expected navigation succeeded
         """
-        logger.info(
-            f"DEBUG: Starting form submission with retry. Form: {form_selector}, Button: {submit_button_selector}"
-        )
-
-        # Log the form's action attribute to debug
-        try:
-            form_action = self.page.locator(form_selector).evaluate("form => form.action")
-            logger.info(f"DEBUG: Form action URL: {form_action}")
-        except Exception as e:
-            logger.error(f"DEBUG: Could not get form action: {str(e)}")
+        logger.debug("Starting form submission with retry. Form: %s, Button: %s", form_selector, submit_button_selector)
 
-        # Log submit button details
-        if submit_button_selector:
+        # Log the form's action and submit button details to debug
+        if logger.isEnabledFor(logging.DEBUG):
             try:
-                button_exists = self.page.locator(submit_button_selector).count() > 0
-                logger.info(f"DEBUG: Submit button exists: {button_exists}")
-                if button_exists:
-                    button_text = self.page.locator(submit_button_selector).text_content()
-                    logger.info(f"DEBUG: Submit button text: {button_text}")
+                logger.debug("Form action URL: %s", self._locator(form_selector).evaluate("form => form.action"))
             except Exception as e:
-                logger.error(f"DEBUG: Error checking submit button: {str(e)}")
+                logger.error("Could not get form action: %s", e)
+
+            if submit_button_selector:
+                try:
+                    button_texts = self._locator(submit_button_selector).all_text_contents()
+                    logger.debug("Submit button exists: %s, text: %s", bool(button_texts), button_texts)
+                except Exception as e:
+                    logger.error("Error checking submit button: %s", e)
 
         for attempt in range(max_retries):
-            logger.info(f"DEBUG: Form submission attempt {attempt + 1} of {max_retries}")
+            logger.debug("Form submission attempt %d of %d", attempt + 1, max_retries)
 
             # Log the form content before submission
-            try:
-                form_html = self.page.locator(form_selector).evaluate("form => form.outerHTML")
-                logger.info(f"DEBUG: Form HTML before submission:\n{form_html}")
-
-                # Log form field values
-                form_fields = self.page.locator(
-                    f"{form_selector} input, {form_selector} select, {form_selector} textarea"
-                ).all()
-                logger.info(f"DEBUG: Found {len(form_fields)} form fields")
-                for field in form_fields:
-                    try:
-                        field_name = field.get_attribute("name")
-                        field_id = field.get_attribute("id")
-                        field_type = field.get_attribute("type")
-
-                        value = None
-                        if field_type == "checkbox" or field_type == "radio":
-                            value = field.is_checked()
-                        else:
-                            value = field.input_value()
-
-                        logger.info(f"DEBUG: Field {field_name} (id: {field_id}, type: {field_type}): '{value}'")
-                    except Exception as e:
-                        logger.error(f"DEBUG: Error getting field info: {str(e)}")
-            except Exception as e:
-                logger.error(f"DEBUG: Error logging form content: {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    form_html = self._locator(form_selector).evaluate("form => form.outerHTML")
+                    logger.debug("Form HTML before submission:\n%s", form_html)
+
+                    # Log form field values
+                    form_fields = self._locator(
+                        f"{form_selector} input, {form_selector} select, {form_selector} textarea"
+                    ).all()
+                    logger.debug("Found %d form fields", len(form_fields))
+                    for field in form_fields:
+                        try:
+                            field_name = field.get_attribute("name")
+                            field_id = field.get_attribute("id")
+                            field_type = field.get_attribute("type")
+
+                            value = None
+                            if field_type == "checkbox" or field_type == "radio":
+                                value = field.is_checked()
+                            else:
+                                value = field.input_value()
+
+                            logger.debug("Field %s (id: %s, type: %s): '%s'", field_name, field_id, field_type, value)
+                        except Exception as e:
+                            logger.error("Error getting field info: %s", e)
+                except Exception as e:
+                    logger.error("Error logging form content: %s", e)
 
             success = self.submit_form(form_selector, submit_button_selector, expected_redirect)
 
             if success:
-                logger.info("DEBUG: Form submission successful!")
+                logger.debug("Form submission successful")
                 return True
 
+            if self._locator(VALIDATION_ERROR_SELECTORS).count() > 0:
+                logger.error("Form shows validation errors, not retrying")
+                return False
+
             # If we're supposed to be redirected but we're not, let's check the current page
             if expected_redirect and attempt < max_retries - 1:
-                logger.info(f"DEBUG: Retry attempt {attempt + 1}: Current URL: {self.page.url}")
-                expected_url = f"{self.base_url}{expected_redirect}"
-                logger.info(f"DEBUG: Expected URL: {expected_url}")
+                logger.info("Retry attempt %d: Current URL: %s", attempt + 1, self.page.url)
+                logger.info("Expected URL: %s%s", self.base_url, expected_redirect)
 
                 # Check page content for clues about failure
                 try:
-                    logger.info("DEBUG: Page content after failed submission:")
-                    page_content = self.page.content()
-                    logger.info(f"DEBUG: Page title: {self.page.title()}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Page title after failed submission: %s", self.page.title())
 
                     # Look for various types of error messages
-                    selectors = [
-                        ".error-message",
-                        ".field-error",
-                        ".validation-error",
-                        ".alert",
-                        "#error-message",
-                        ".form-error",
-                    ]
-
-                    for selector in selectors:
-                        error_elements = self.page.locator(selector).all()
-                        if error_elements:
-                            logger.warning(f"DEBUG: Found {len(error_elements)} errors with selector '{selector}':")
-                            for error in error_elements:
-                                logger.warning(f"DEBUG: - {error.text_content()}")
+                    if logger.isEnabledFor(logging.WARNING):
+                        for error_text in self._locator(ERROR_SELECTORS_COMPOUND).all_text_contents():
+                            logger.warning("- %s", error_text)
                 except Exception as e:
-                    logger.error(f"DEBUG: Error checking page content: {str(e)}")
+                    logger.error("Error checking page content: %s", e)
+
+            if attempt < max_retries - 1:
+                self.page.wait_for_timeout(RETRY_BACKOFF_MS * 2**attempt)  # ALLOW_WAIT: backoff between retries
 
-        logger.error("DEBUG: All form submission attempts failed")
+        logger.error("All form submission attempts failed")
         return False
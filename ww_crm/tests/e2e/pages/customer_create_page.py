@@ -3,8 +3,8 @@ Customer create page object for UI testing.
 """
 
 import logging
-from playwright.sync_api import Page
-from .base_page import NavigablePage, FormPage
+from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeoutError
+from .base_page import ERROR_SELECTORS_COMPOUND, NavigablePage, FormPage
 from .selectors import CustomerPageSelectors
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,19 @@ class CustomerCreatePage(NavigablePage, FormPage):
     and FormPage without breaking their contracts.
     """
 
+    CREATE_PATH = "/customers/create"
+    LIST_PATH = "/customers"
+
+    # Customer data keys paired with the form field each one fills
+    FIELD_MAPPING = (
+        ("name", CustomerPageSelectors.NAME_INPUT),
+        ("phone", CustomerPageSelectors.PHONE_INPUT),
+        ("email", CustomerPageSelectors.EMAIL_INPUT),
+        ("address", CustomerPageSelectors.ADDRESS_INPUT),
+        ("service_units", CustomerPageSelectors.SERVICE_UNITS_INPUT),
+        ("notes", CustomerPageSelectors.NOTES_INPUT),
+    )
+
     def __init__(self, page: Page, base_url: str):
         """
         Initialize the customer creation page object.
@@ -29,16 +42,18 @@ class CustomerCreatePage(NavigablePage, FormPage):
             base_url: The base URL of the application
         """
         super().__init__(page, base_url)
+        self.create_url = f"{base_url}{self.CREATE_PATH}"
+        self.list_url = f"{base_url}{self.LIST_PATH}"
 
     def navigate(self):
         """Navigate to the customer creation page."""
         logger.info("Navigating to customer creation page")
-        self.navigate_to("/customers/create")
+        self.navigate_to(self.CREATE_PATH)
 
     def assert_page_loaded(self):
         """Assert that the customer creation page is loaded correctly."""
         logger.debug("Verifying customer creation page loaded")
-        self.assert_url("/customers/create")
+        self.assert_url(self.CREATE_PATH)
         self.assert_element_visible(CustomerPageSelectors.CREATE_HEADING, "Create Customer heading")
         self.assert_element_visible(CustomerPageSelectors.CUSTOMER_FORM, "Customer form")
 
@@ -54,24 +69,15 @@ class CustomerCreatePage(NavigablePage, FormPage):
             Dictionary of field selectors and values that were filled
         """
         logger.info("Filling customer form")
-        field_mapping = {
-            "name": CustomerPageSelectors.NAME_INPUT,
-            "phone": CustomerPageSelectors.PHONE_INPUT,
-            "email": CustomerPageSelectors.EMAIL_INPUT,
-            "address": CustomerPageSelectors.ADDRESS_INPUT,
-            "service_units": CustomerPageSelectors.SERVICE_UNITS_INPUT,
-            "notes": CustomerPageSelectors.NOTES_INPUT,
+        fields_to_fill = {
+            selector: customer_data[field_name]
+            for field_name, selector in self.FIELD_MAPPING
+            if field_name in customer_data
         }
-
-        # Create a dictionary of field selectors and values
-        fields_to_fill = {}
-        for field_name, selector in field_mapping.items():
-            if field_name in customer_data:
-                fields_to_fill[selector] = customer_data[field_name]
-                logger.debug(f"Will fill {field_name} with: {customer_data[field_name]}")
+        logger.debug("Will fill customer form fields: %s", fields_to_fill)
 
         # Fill the form fields
-        self.fill_form_fields(fields_to_fill)
+        self.fill_form_fields(fields_to_fill, root_selector=CustomerPageSelectors.CUSTOMER_FORM)
         return fields_to_fill
 
     def click_save_button(self):
@@ -87,7 +93,7 @@ class CustomerCreatePage(NavigablePage, FormPage):
     def create_customer(self, customer_data):
         """
         Create a new customer by filling the form and clicking save.
-        Uses improved form submission with retry logic.
+        Submits with a single click and auto-waits for the redirect to the customer list.
 
         Args:
             customer_data: Dictionary containing customer data
@@ -95,126 +101,48 @@ class CustomerCreatePage(NavigablePage, FormPage):
         Returns:
             tuple: (success, customer_name) - Whether the submission succeeded and the customer name
         """
-        logger.info(f"DEBUG: Creating new customer: {customer_data.get('name', 'Unknown')}")
-        logger.info(f"DEBUG: Customer data: {customer_data}")
+        name = customer_data.get("name", "Unknown")
+        logger.info("Creating new customer: %s", name)
+        logger.debug("Customer data: %s", customer_data)
 
         # Ensure we're on the create page
         current_url = self.page.url
-        create_url = f"{self.base_url}/customers/create"
-        if not current_url.startswith(create_url):
-            logger.info(f"DEBUG: Not on create page. Current URL: {current_url}, Expected: {create_url}")
+        if not current_url.startswith(self.create_url):
+            logger.debug("Not on create page. Current URL: %s, Expected: %s", current_url, self.create_url)
             self.navigate()
-            logger.info(f"DEBUG: Navigated to create page: {self.page.url}")
 
-        # Fill the form with extra logging
-        logger.info("DEBUG: Starting to fill customer form")
         filled_fields = self.fill_customer_form(customer_data)
-        logger.info(f"DEBUG: Filled {len(filled_fields)} form fields")
-
-        # Try a more direct approach to submit the form to avoid JavaScript hanging
-        logger.info("DEBUG: Attempting to submit customer form - direct approach")
-        success = False
+        logger.debug("Filled %d form fields", len(filled_fields))
 
+        # Click save once and let Playwright auto-wait for the redirect to the list page
         try:
-            # First, try just clicking the submit button directly
-            button = self.page.locator(CustomerPageSelectors.BTN_SAVE_CUSTOMER)
-
-            if button.count() > 0:
-                logger.info("DEBUG: Submit button found, clicking it directly")
-
-                # Set up navigation expectation
-                expected_url = f"{self.base_url}/customers"
-
-                try:
-                    with self.page.expect_navigation(timeout=5000) as nav_info:
-                        button.click(timeout=3000)
-
-                    # Check if navigation succeeded
-                    if nav_info.value and nav_info.value.url == expected_url:
-                        logger.info(f"DEBUG: Successfully navigated to: {expected_url}")
-                        success = True
-                    else:
-                        current_url = self.page.url
-
-                        # Double check we got to the right place
-                        if current_url == expected_url:
-                            logger.info(f"DEBUG: Current URL matches expected: {expected_url}")
-                            success = True
-                        else:
-                            logger.warning(
-                                f"DEBUG: Navigation didn't match. Expected: {expected_url}, Got: {current_url}"
-                            )
-                except Exception as nav_error:
-                    logger.error(f"DEBUG: Navigation error: {str(nav_error)}")
-
-                    # Check if we're on the right page anyway
-                    if self.page.url == expected_url:
-                        logger.info(f"DEBUG: Despite error, we're on the expected URL: {expected_url}")
-                        success = True
-            else:
-                logger.warning("DEBUG: Submit button not found")
-        except Exception as e:
-            logger.error(f"DEBUG: Error during direct form submission: {str(e)}")
-
-        # If direct approach failed, try a fallback method
-        if not success:
-            logger.info("DEBUG: Direct approach failed, trying fallback method")
-            try:
-                # Use a simple JavaScript form submission approach
-                form_selector = CustomerPageSelectors.CUSTOMER_FORM
-                expected_url = f"{self.base_url}/customers"
-
-                # Try with a minimal JavaScript approach less likely to hang
-                try:
-                    with self.page.expect_navigation(timeout=5000) as nav_info:
-                        # Use a very simple JavaScript submission
-                        self.page.evaluate(
-                            f"""() => {{
-                            const form = document.querySelector('{form_selector}');
-                            if (form) form.submit();
-                        }}"""
-                        )
-
-                    # Check navigation results
-                    if nav_info.value and nav_info.value.url == expected_url:
-                        logger.info(f"DEBUG: Fallback method navigated to: {expected_url}")
-                        success = True
-                    else:
-                        # Double check current URL
-                        if self.page.url == expected_url:
-                            logger.info(f"DEBUG: Fallback succeeded! Current URL: {self.page.url}")
-                            success = True
-                except Exception as js_error:
-                    logger.error(f"DEBUG: Fallback JavaScript error: {str(js_error)}")
-
-                    # Check URL anyway
-                    if self.page.url == expected_url:
-                        logger.info(f"DEBUG: Despite error, fallback succeeded. Current URL: {self.page.url}")
-                        success = True
-            except Exception as fallback_error:
-                logger.error(f"DEBUG: Fallback method failed: {str(fallback_error)}")
+            self._locator(CustomerPageSelectors.BTN_SAVE_CUSTOMER).click(timeout=3000)
+            expect(self.page).to_have_url(self.list_url, timeout=5000)
+            success = True
+        except PlaywrightTimeoutError as click_error:
+            logger.error("Save Customer button could not be clicked: %s", click_error)
+            success = False
+        except AssertionError as nav_error:
+            logger.error("Navigation error: %s", nav_error)
+            success = False
 
         if success:
-            logger.info(f"DEBUG: Customer creation succeeded for {customer_data.get('name', 'Unknown')}")
+            logger.info("Customer creation succeeded for %s", name)
         else:
-            logger.error(f"DEBUG: Customer creation failed for {customer_data.get('name', 'Unknown')}")
-
-            # Check if we're still on the create page or somewhere else
-            current_url = self.page.url
-            logger.info(f"DEBUG: After failed submission, current URL: {current_url}")
+            logger.error("Customer creation failed for %s", name)
 
-            # Check page title for more context
-            page_title = self.page.title()
-            logger.info(f"DEBUG: Current page title: {page_title}")
+            # Check where we ended up for more context
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("After failed submission, current URL: %s", self.page.url)
+                logger.debug("Current page title: %s", self.page.title())
 
             # Check for any visible error messages on the page
             try:
-                error_messages = self.page.locator(".error-message, .alert, .validation-error").all()
-                if error_messages:
-                    logger.error("DEBUG: Found error messages on page:")
-                    for msg in error_messages:
-                        logger.error(f"DEBUG: Error: {msg.text_content()}")
+                if logger.isEnabledFor(logging.ERROR):
+                    error_locator = self._locator(ERROR_SELECTORS_COMPOUND)
+                    for error_text in error_locator.all_text_contents():
+                        logger.error("Error: %s", error_text)
             except Exception as e:
-                logger.error(f"DEBUG: Error checking for error messages: {str(e)}")
+                logger.error("Error checking for error messages: %s", e)
 
-        return success, customer_data.get("name", "Unknown")
+        return success, name
@@ -9,6 +9,9 @@ from .selectors import CustomerPageSelectors
 
 logger = logging.getLogger(__name__)
 
+# Cap on how much table HTML a failure dump writes to the log
+DEBUG_HTML_LIMIT = 16384
+
 
 class CustomerListPage(NavigablePage):
     """
@@ -49,7 +52,6 @@ class CustomerListPage(NavigablePage):
     def click_add_customer(self):
         """Click the Add Customer button."""
         logger.info("Clicking Add Customer button")
-        self.assert_element_visible(CustomerPageSelectors.BTN_ADD_CUSTOMER, "Add Customer button")
         self.click_element(CustomerPageSelectors.BTN_ADD_CUSTOMER, "Add Customer button")
 
     def assert_customer_table_visible(self):
@@ -65,9 +67,9 @@ class CustomerListPage(NavigablePage):
             customer_id: The ID of the customer
             expected_name: The expected name of the customer (optional)
         """
-        logger.debug(f"Verifying customer {customer_id} is visible")
-        self.assert_customer_table_visible()
+        logger.debug("Verifying customer %s is visible", customer_id)
 
+        # A visible row implies a visible table, so the table isn't checked separately
         customer_row_selector = CustomerPageSelectors.customer_row(customer_id)
         self.assert_element_visible(customer_row_selector, f"Customer row {customer_id}")
 
@@ -84,61 +86,41 @@ class CustomerListPage(NavigablePage):
         Args:
             name: The name of the customer to check for
         """
-        logger.info(f"DEBUG: Verifying customer with name '{name}' exists")
+        logger.debug("Verifying customer with name '%s' exists", name)
         self.assert_customer_table_visible()
 
-        # Wait to ensure the table is fully populated
+        table_selector = CustomerPageSelectors.LIST_TABLE
         try:
-            table_selector = CustomerPageSelectors.LIST_TABLE
-            # Get all customer rows in the table
-            rows = self.page.locator(f"{table_selector} tr").all()
+            # The id prefix skips the header row; all row texts come back in one call
+            row_texts = self._locator(CustomerPageSelectors.CUSTOMER_ROWS).all_text_contents()
+            if any(name in text for text in row_texts):
+                logger.debug("Found customer '%s' in table", name)
+                return True
 
-            # Log all customer names found in the table for debugging
-            names_found = []
-            for row in rows:
-                try:
-                    # Skip header row if it exists
-                    if row.get_attribute("id") and "customer-" in row.get_attribute("id"):
-                        row_text = row.text_content()
-                        names_found.append(row_text)
-                        if name in row_text:
-                            logger.info(f"DEBUG: Found customer '{name}' in table")
-                            return True
-                except Exception as row_error:
-                    logger.error(f"DEBUG: Error processing row: {str(row_error)}")
-
-            logger.warning(f"DEBUG: Customer '{name}' not found in table. Names found: {names_found}")
-
-            # Fallback to the original assertion if iterative search fails
-            logger.info(f"DEBUG: Falling back to text content search for '{name}'")
+            logger.warning("Customer '%s' not found in table. Names found: %s", name, row_texts)
+
+            # Fallback to the auto-waiting assertion in case the table is still being populated
+            logger.debug("Falling back to text content search for '%s'", name)
             self.assert_element_contains_text(table_selector, name, f"Customer with name '{name}'")
             return True
         except Exception as e:
-            logger.error(f"DEBUG: Error during customer search: {str(e)}")
-
-            # Take a screenshot for debugging
-            try:
-                screenshot_path = f"customer_search_failed_{name.replace(' ', '_')}.png"
-                self.page.screenshot(path=screenshot_path)
-                logger.info(f"DEBUG: Saved screenshot to {screenshot_path}")
-            except Exception as ss_error:
-                logger.error(f"DEBUG: Failed to capture screenshot: {str(ss_error)}")
-
-            # Get page HTML for debugging
-            try:
-                page_html = self.page.content()
-                logger.info(f"DEBUG: Page title: {self.page.title()}")
-                logger.info(f"DEBUG: Page URL: {self.page.url}")
-
-                # Check if the table exists
-                table_exists = self.page.locator(CustomerPageSelectors.LIST_TABLE).count() > 0
-                logger.info(f"DEBUG: Table exists: {table_exists}")
-
-                if table_exists:
-                    table_html = self.page.locator(CustomerPageSelectors.LIST_TABLE).evaluate("el => el.outerHTML")
-                    logger.info(f"DEBUG: Table HTML:\n{table_html}")
-            except Exception as html_error:
-                logger.error(f"DEBUG: Failed to get page HTML: {str(html_error)}")
+            logger.error("Error during customer search: %s", e)
+
+            # Dump the table HTML only when someone is reading debug logs; pytest-playwright
+            # takes the failure screenshot (--screenshot=only-on-failure)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    logger.debug("Page URL: %s", self.page.url)
+
+                    # One round-trip; None when the table is missing
+                    table_html = self.page.evaluate(
+                        "sel => document.querySelector(sel)?.outerHTML ?? null", table_selector
+                    )
+                    logger.debug("Table exists: %s", table_html is not None)
+                    if table_html is not None:
+                        logger.debug("Table HTML:\n%s", table_html[:DEBUG_HTML_LIMIT])
+                except Exception as html_error:
+                    logger.error("Failed to get page HTML: %s", html_error)
 
             raise AssertionError(f"Customer with name '{name}' not found in customer table")
 
@@ -149,7 +131,7 @@ class CustomerListPage(NavigablePage):
         Args:
             customer_id: The ID of the customer
         """
-        logger.info(f"Clicking view button for customer {customer_id}")
+        logger.info("Clicking view button for customer %s", customer_id)
         selector = CustomerPageSelectors.btn_view_customer(customer_id)
         self.click_element(selector, f"View button for customer {customer_id}")
 
@@ -160,6 +142,6 @@ class CustomerListPage(NavigablePage):
         Args:
             customer_id: The ID of the customer
         """
-        logger.info(f"Clicking delete button for customer {customer_id}")
+        logger.info("Clicking delete button for customer %s", customer_id)
         selector = CustomerPageSelectors.btn_delete_customer(customer_id)
         self.click_element(selector, f"Delete button for customer {customer_id}")
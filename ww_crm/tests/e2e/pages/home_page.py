@@ -2,10 +2,13 @@
 Home page object for UI testing.
 """
 
-from playwright.sync_api import Page
+import logging
+from playwright.sync_api import Page, expect
 from .base_page import NavigablePage
 from .selectors import HomePageSelectors
 
+logger = logging.getLogger(__name__)
+
 
 class HomePage(NavigablePage):
     """
@@ -15,6 +18,14 @@ class HomePage(NavigablePage):
     only on home page specific interactions and verifications.
     """
 
+    TITLE = "Home - Window Wash CRM"
+
+    # Matches the navigation links and welcome content only while they are visible
+    VISIBLE_LAYOUT = ", ".join(
+        [NavigablePage.VISIBLE_NAV_LINKS]
+        + [f"{selector}:visible" for selector in (HomePageSelectors.WELCOME_HEADING, HomePageSelectors.WELCOME_MESSAGE)]
+    )
+
     def __init__(self, page: Page, base_url: str):
         """
         Initialize the home page object.
@@ -31,11 +42,23 @@ class HomePage(NavigablePage):
 
     def assert_page_loaded(self):
         """Assert that the home page is loaded correctly."""
-        # Check page title
-        expect_title = "Home - Window Wash CRM"
-        actual_title = self.page.title()
-        assert actual_title == expect_title, f"Expected title '{expect_title}', got '{actual_title}'"
+        # Check page title; expect() waits for it, since navigate() returns as soon as the response commits
+        expect(self.page).to_have_title(self.TITLE)
 
         # Check content elements
         self.assert_element_visible(HomePageSelectors.WELCOME_HEADING, "Welcome heading")
         self.assert_element_visible(HomePageSelectors.WELCOME_MESSAGE, "Welcome message")
+
+    def assert_layout_ready(self):
+        """
+        Assert the title, navigation links and welcome content are in place.
+
+        The five elements are checked by one auto-waiting count assertion
+        rather than one visibility assertion each.
+        """
+        expect(self.page).to_have_title(self.TITLE)
+        try:
+            expect(self._locator(self.VISIBLE_LAYOUT)).to_have_count(5)
+        except Exception as e:
+            logger.error("Home page layout not visible (selector: %s)", self.VISIBLE_LAYOUT)
+            raise AssertionError("Expected navigation links and welcome content to be visible") from e
@@ -54,7 +54,7 @@ class InvoiceListPage(NavigablePage):
             expected_amount: The expected amount of the invoice (optional)
             expected_customer_name: The expected customer name (optional)
         """
-        logger.debug(f"Verifying invoice {invoice_id} is visible")
+        logger.debug("Verifying invoice %s is visible", invoice_id)
         invoice_row_selector = InvoicePageSelectors.invoice_row(invoice_id)
         self.assert_element_visible(invoice_row_selector, f"Invoice row {invoice_id}")
 
@@ -76,22 +76,28 @@ class InvoiceListPage(NavigablePage):
         Args:
             invoice_id: The ID of the invoice
         """
-        logger.info(f"Clicking view button for invoice {invoice_id}")
+        logger.info("Clicking view button for invoice %s", invoice_id)
         selector = InvoicePageSelectors.btn_view_invoice(invoice_id)
         self.click_element(selector, f"View button for invoice {invoice_id}")
 
-    def click_delete_invoice(self, invoice_id):
+    def click_delete_invoice(self, invoice_id, accept=True):
         """
-        Click the Delete button for a specific invoice.
+        Click the Delete button for a specific invoice and answer the confirm dialog.
+
+        The dialog is awaited around the click, so the native confirm() is answered
+        as soon as it opens, and nothing stays registered on the shared page if the
+        click fails or no dialog appears.
 
         Args:
             invoice_id: The ID of the invoice
+            accept: Whether to accept (True) or dismiss (False) the confirm dialog
         """
-        logger.info(f"Clicking delete button for invoice {invoice_id}")
+        logger.info("Clicking delete button for invoice %s", invoice_id)
         selector = InvoicePageSelectors.btn_delete_invoice(invoice_id)
-        self.click_element(selector, f"Delete button for invoice {invoice_id}")
-
-        # Benefit: Playwright naturally handles dialog timing
-        # - Automatically waits for dialog to appear
-        # - Adapts to different application response times
-        # - No need for arbitrary timeouts that might be too short or too long
+        with self.page.expect_event("dialog") as dialog_info:
+            self.click_element(selector, f"Delete button for invoice {invoice_id}")
+        dialog = dialog_info.value
+        if accept:
+            dialog.accept()
+        else:
+            dialog.dismiss()
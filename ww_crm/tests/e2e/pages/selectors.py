@@ -3,8 +3,16 @@ Selector registry for UI testing.
 
 This module centralizes all CSS selectors used in page objects,
 making them easier to maintain and update when the UI changes.
+
+The per-ID selector builders are memoized, so repeated lookups for the same
+record return the identical string instead of re-formatting it.
 """
 
+from functools import lru_cache
+
+# Upper bound on cached selectors per builder; far above the rows any test creates
+SELECTOR_CACHE_SIZE = 4096
+
 
 class NavigationSelectors:
     """Selectors for navigation elements common across pages."""
@@ -30,6 +38,7 @@ class CustomerPageSelectors:
     LIST_HEADING = "#customers-heading"
     LIST_TABLE = "#customers-table"
     BTN_ADD_CUSTOMER = "#btn-add-customer"
+    CUSTOMER_ROWS = '#customers-table tr[id^="customer-"]'
 
     # Create page
     CREATE_HEADING = "#create-customer-heading"
@@ -44,21 +53,25 @@ class CustomerPageSelectors:
     BTN_CANCEL = "#btn-cancel"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def customer_row(customer_id):
         """Generate selector for a customer row by ID."""
         return f"#customer-{customer_id}"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def customer_name_cell(customer_id):
         """Generate selector for a customer name cell by ID."""
         return f"#customer-{customer_id} .customer-name"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def btn_view_customer(customer_id):
         """Generate selector for a view customer button by ID."""
         return f"#btn-view-customer-{customer_id}"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def btn_delete_customer(customer_id):
         """Generate selector for a delete customer button by ID."""
         return f"#btn-delete-customer-{customer_id}"
@@ -73,26 +86,31 @@ class InvoicePageSelectors:
     BTN_ADD_INVOICE = "#btn-add-invoice"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def invoice_row(invoice_id):
         """Generate selector for an invoice row by ID."""
         return f"#invoice-{invoice_id}"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def invoice_customer_cell(invoice_id):
         """Generate selector for an invoice customer cell by ID."""
         return f"#invoice-{invoice_id} .invoice-customer"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def invoice_amount_cell(invoice_id):
         """Generate selector for an invoice amount cell by ID."""
         return f"#invoice-{invoice_id} .invoice-amount"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def btn_view_invoice(invoice_id):
         """Generate selector for a view invoice button by ID."""
         return f"#btn-view-invoice-{invoice_id}"
 
     @staticmethod
+    @lru_cache(maxsize=SELECTOR_CACHE_SIZE)
     def btn_delete_invoice(invoice_id):
         """Generate selector for a delete invoice button by ID."""
         return f"#btn-delete-invoice-{invoice_id}"
@@ -5,17 +5,20 @@ These tests capture screenshots of different pages in the application and compar
 against baseline images to detect unintended visual changes in the UI.
 """
 
+import io
 import os
 import logging
 import pytest
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image, ImageChops, ImageStat
+import numpy as np
+from PIL import Image
 from playwright.sync_api import Page, expect
 
-from ww_crm.tests.e2e.pages.home_page import HomePage
-from ww_crm.tests.e2e.pages.customer_list_page import CustomerListPage
-from ww_crm.tests.e2e.pages.customer_create_page import CustomerCreatePage
-from ww_crm.tests.e2e.pages.invoice_list_page import InvoiceListPage
+try:
+    import cv2  # Optional: SIMD absdiff for large screenshots
+except ImportError:
+    cv2 = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -30,6 +33,49 @@ ACTUAL_DIR = SCREENSHOT_DIR / "actual"
 DIFF_DIR = SCREENSHOT_DIR / "diff"
 THRESHOLD = 0.01  # Threshold for image difference (1%)
 
+
+@pytest.fixture(scope="session", autouse=True)
+def screenshot_dirs():
+    """Create the screenshot directories once per session."""
+    for directory in [BASELINE_DIR, ACTUAL_DIR, DIFF_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def load_baseline(path):
+    """
+    Decode a baseline PNG once per session.
+
+    Returns:
+        tuple: (mode, pixels) - The PIL image mode and a read-only pixel array
+    """
+    with Image.open(path) as img:
+        pixels = np.asarray(img)
+    pixels.flags.writeable = False
+    return img.mode, pixels
+
+
+def absolute_difference(baseline, actual):
+    """
+    Return the per-pixel absolute difference of two same-shaped uint8 image arrays.
+
+    Uses OpenCV's absdiff when it is installed, otherwise NumPy with an int16
+    intermediate so the subtraction can't wrap around.
+    """
+    if cv2 is not None:
+        return cv2.absdiff(baseline, actual)
+    diff = baseline.astype(np.int16)
+    np.subtract(diff, actual, out=diff)
+    return np.abs(diff, out=diff)
+
+
+def difference_ratio(diff):
+    """Return the mean of an absolute-difference array over its color channels, from 0 to 1."""
+    if diff.ndim == 3:  # RGB or RGBA
+        diff = diff[..., :3]
+    return float(diff.mean()) / 255
+
+
 @pytest.mark.skip("skipping tests (for now) that require installation of test browser")
 class TestVisual:
     """
@@ -39,46 +85,41 @@ class TestVisual:
     against baseline images to detect unintended visual changes.
     """
 
-    @pytest.fixture(autouse=True)
-    def setup(self, page: Page, live_server):
-        """Set up page objects and directories for each test."""
-        logger.info("Setting up visual regression test")
+    @pytest.fixture(autouse=True, scope="class")
+    def setup(self, request, page: Page, pages):
+        """Set up page objects once for the class."""
+        logger.info("Setting up visual regression tests")
 
-        # Create screenshot directories if they don't exist
-        for directory in [BASELINE_DIR, ACTUAL_DIR, DIFF_DIR]:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        # Initialize page objects
-        self.home_page = HomePage(page, live_server.url())
-        self.customer_list_page = CustomerListPage(page, live_server.url())
-        self.customer_create_page = CustomerCreatePage(page, live_server.url())
-        self.invoice_list_page = InvoiceListPage(page, live_server.url())
+        # Page objects are shared across the module and built on first use
+        request.cls.pages = pages
 
         # Store context for later use
-        self.page = page
-        self.live_server = live_server
+        request.cls.page = page
 
     def take_screenshot(self, name):
         """
-        Take a screenshot of the current page.
+        Take a screenshot of the current page, kept in memory.
 
         Args:
             name: Name of the screenshot (without extension)
 
         Returns:
-            Path to the screenshot
+            bytes: The PNG-encoded screenshot
         """
-        filepath = ACTUAL_DIR / f"{name}.png"
-        self.page.screenshot(path=str(filepath), full_page=True)
-        logger.info(f"Captured screenshot: {filepath}")
-        return filepath
+        png_bytes = self.page.screenshot(full_page=True)
+        logger.info("Captured screenshot: %s (%d bytes)", name, len(png_bytes))
+        return png_bytes
 
-    def compare_screenshots(self, name):
+    def compare_screenshots(self, name, png_bytes):
         """
         Compare the actual screenshot with the baseline.
 
+        The actual screenshot is only written to disk when it differs from the
+        baseline by more than THRESHOLD, for debugging.
+
         Args:
             name: Name of the screenshot (without extension)
+            png_bytes: The PNG-encoded actual screenshot
 
         Returns:
             float: Difference ratio (0 to 1)
@@ -87,43 +128,50 @@ class TestVisual:
         actual_path = ACTUAL_DIR / f"{name}.png"
         diff_path = DIFF_DIR / f"{name}.png"
 
-        # If baseline doesn't exist, copy actual to baseline and pass the test
+        # If baseline doesn't exist, save actual as the baseline and pass the test
         if not baseline_path.exists():
-            logger.info(f"Baseline doesn't exist, creating: {baseline_path}")
-            import shutil
-
-            shutil.copy(actual_path, baseline_path)
+            logger.info("Baseline doesn't exist, creating: %s", baseline_path)
+            baseline_path.write_bytes(png_bytes)
             return 0
 
-        # Compare images
-        baseline_img = Image.open(baseline_path)
-        actual_img = Image.open(actual_path)
+        # Byte-identical screenshots (the usual case on a green build) need no decoding
+        if baseline_path.stat().st_size == len(png_bytes) and baseline_path.read_bytes() == png_bytes:
+            logger.info("Screenshot is identical to baseline")
+            actual_path.unlink(missing_ok=True)
+            diff_path.unlink(missing_ok=True)
+            return 0.0
+
+        # Compare images; the baseline is decoded once per session
+        baseline_mode, baseline = load_baseline(str(baseline_path))
+        baseline_size = (baseline.shape[1], baseline.shape[0])
+        actual_img = Image.open(io.BytesIO(png_bytes))
+
+        # Make sure the images have the same mode and size
+        if actual_img.mode != baseline_mode:
+            actual_img = actual_img.convert(baseline_mode)
+        if actual_img.size != baseline_size:
+            logger.warning("Image sizes don't match! Baseline: %s, Actual: %s", baseline_size, actual_img.size)
+            actual_img = actual_img.resize(baseline_size)
 
-        # Make sure the images are the same size
-        if baseline_img.size != actual_img.size:
-            logger.warning(f"Image sizes don't match! Baseline: {baseline_img.size}, Actual: {actual_img.size}")
-            actual_img = actual_img.resize(baseline_img.size)
+        actual = np.asarray(actual_img)
 
-        # Calculate difference
-        diff_img = ImageChops.difference(baseline_img, actual_img)
-        stat = ImageStat.Stat(diff_img)
+        # Calculate the per-pixel difference in one vectorized pass
+        diff = absolute_difference(baseline, actual)
 
-        # Calculate the average difference across all channels
-        if len(stat.mean) >= 3:  # RGB or RGBA
-            diff_ratio = sum(stat.mean[:3]) / (3 * 255)
-        else:  # Grayscale
-            diff_ratio = stat.mean[0] / 255
+        # Calculate the average difference across the color channels
+        diff_ratio = difference_ratio(diff)
 
-        # Save the diff image if there's a significant difference
+        # Save the actual and diff images if there's a significant difference
         if diff_ratio > THRESHOLD:
-            logger.info(f"Visual difference detected: {diff_ratio:.4f}, saving diff to {diff_path}")
-            diff_img.save(diff_path)
+            logger.info("Visual difference detected: %.4f, saving diff to %s", diff_ratio, diff_path)
+            actual_path.write_bytes(png_bytes)
+            Image.fromarray(diff.astype(np.uint8)).convert("RGB").save(diff_path)
         else:
-            logger.info(f"Images match within threshold: {diff_ratio:.4f}")
+            logger.info("Images match within threshold: %.4f", diff_ratio)
 
-            # Delete the diff file if it exists
-            if diff_path.exists():
-                diff_path.unlink()
+            # Delete stale actual and diff files if they exist
+            actual_path.unlink(missing_ok=True)
+            diff_path.unlink(missing_ok=True)
 
         return diff_ratio
 
@@ -135,10 +183,10 @@ class TestVisual:
             name: Name of the screenshot (without extension)
         """
         # Take screenshot
-        self.take_screenshot(name)
+        png_bytes = self.take_screenshot(name)
 
         # Compare with baseline
-        diff_ratio = self.compare_screenshots(name)
+        diff_ratio = self.compare_screenshots(name, png_bytes)
 
         # Assert difference is below threshold
         assert diff_ratio <= THRESHOLD, f"Visual regression detected: {diff_ratio:.4f} > {THRESHOLD}"
@@ -148,8 +196,8 @@ class TestVisual:
         logger.info("Running visual test: home_page")
 
         # Navigate to home page
-        self.home_page.navigate()
-        self.home_page.assert_page_loaded()
+        self.pages.home_page.navigate()
+        self.pages.home_page.assert_page_loaded()
 
         # Verify visual appearance matches baseline
         self.assert_visual_match("home_page")
@@ -159,8 +207,8 @@ class TestVisual:
         logger.info("Running visual test: customer_list")
 
         # Navigate to customer list page
-        self.customer_list_page.navigate()
-        self.customer_list_page.assert_page_loaded()
+        self.pages.customer_list_page.navigate()
+        self.pages.customer_list_page.assert_page_loaded()
 
         # Verify visual appearance matches baseline
         self.assert_visual_match("customer_list")
@@ -170,8 +218,8 @@ class TestVisual:
         logger.info("Running visual test: customer_create")
 
         # Navigate to customer create page
-        self.customer_create_page.navigate()
-        self.customer_create_page.assert_page_loaded()
+        self.pages.customer_create_page.navigate()
+        self.pages.customer_create_page.assert_page_loaded()
 
         # Verify visual appearance matches baseline
         self.assert_visual_match("customer_create")
@@ -181,8 +229,8 @@ class TestVisual:
         logger.info("Running visual test: invoice_list")
 
         # Navigate to invoice list page
-        self.invoice_list_page.navigate()
-        self.invoice_list_page.assert_page_loaded()
+        self.pages.invoice_list_page.navigate()
+        self.pages.invoice_list_page.assert_page_loaded()
 
         # Verify visual appearance matches baseline
         self.assert_visual_match("invoice_list")
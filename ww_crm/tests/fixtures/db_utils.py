@@ -6,6 +6,8 @@ cleaning up test data, and other database-related test utilities.
 """
 
 from typing import Dict, List, Union, Optional
+import factory
+from sqlalchemy import delete, func, select
 from ww_crm.models import Customer, Invoice
 from ww_crm.db import db
 from .factories import CustomerFactory, InvoiceFactory
@@ -28,14 +30,19 @@ def seed_test_data(
     if session is None:
         session = db.session
 
-    # Create customers
-    customers = CustomerFactory.create_batch(size=num_customers)
+    # Build customers and their invoices without persisting them; the factories
+    # would otherwise commit once per object
+    customers = CustomerFactory.build_batch(size=num_customers)
 
-    # Create invoices for each customer
-    invoices = []
-    for customer in customers:
-        customer_invoices = InvoiceFactory.create_batch(size=invoices_per_customer, customer=customer)
-        invoices.extend(customer_invoices)
+    # One batch for all invoices, handed out to the customers in turn
+    invoices = InvoiceFactory.build_batch(
+        size=num_customers * invoices_per_customer, customer=factory.Iterator(customers)
+    )
+
+    # Insert everything in a single transaction
+    session.add_all(customers)
+    session.add_all(invoices)
+    session.commit()
 
     # Return all created objects
     return {"customers": customers, "invoices": invoices}
@@ -51,11 +58,9 @@ def clear_test_data(session: Optional[object] = None) -> None:
     if session is None:
         session = db.session
 
-    # Delete all invoices first (due to foreign key constraints)
-    session.query(Invoice).delete()
-
-    # Then delete all customers
-    session.query(Customer).delete()
+    # Bulk DELETE statements, invoices first (due to foreign key constraints)
+    session.execute(delete(Invoice))
+    session.execute(delete(Customer))
 
     # Commit the transaction
     session.commit()
@@ -75,4 +80,4 @@ def count_records(model_class: object, session: Optional[object] = None) -> int:
     if session is None:
         session = db.session
 
-    return session.query(model_class).count()
+    return session.execute(select(func.count()).select_from(model_class)).scalar()
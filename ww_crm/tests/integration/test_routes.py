@@ -6,6 +6,19 @@ from flask import url_for
 pytestmark = pytest.mark.integration
 
 
+class TestHomeRoutes:
+    """Tests for the home page route."""
+
+    def test_homepage_renders_layout(self, client):
+        """Test that the home page renders the title, navigation and welcome content."""
+        response = client.get("/")
+        assert response.status_code == 200
+        assert b"<title>Home - Window Wash CRM</title>" in response.data
+        assert b'id="main-nav"' in response.data
+        assert b'<h1 id="welcome-heading">Welcome to Window Wash CRM</h1>' in response.data
+        assert b'id="welcome-message"' in response.data
+
+
 class TestCustomerRoutes:
     """Tests for customer-related routes."""
 
@@ -14,6 +27,16 @@ class TestCustomerRoutes:
         response = client.get("/customers")
         assert response.status_code == 200
 
+    def test_list_customers_negotiates_json(self, client, sample_customer):
+        """Test that a JSON-preferring Accept header with fallbacks gets JSON back."""
+        response = client.get("/customers", headers={"Accept": "application/json, text/plain, */*"})
+        assert response.status_code == 200
+        assert response.is_json
+
+        response = client.get("/customers", headers={"Accept": "*/*"})
+        assert response.status_code == 200
+        assert not response.is_json
+
     def test_create_customer(self, client):
         """Test the customer creation route."""
         data = {
@@ -30,6 +53,30 @@ class TestCustomerRoutes:
         assert response.status_code == 201
         assert b"New Customer" in response.data
 
+    def test_create_customer_json_with_charset(self, client):
+        """Test that a JSON body is parsed as JSON even when its content type has parameters."""
+        data = {"name": "Charset Customer", "phone": "555-111-2222"}
+
+        response = client.post(
+            "/customers/create", data=json.dumps(data), content_type="application/json; charset=utf-8"
+        )
+
+        assert response.status_code == 201
+        assert response.is_json
+        assert response.json["name"] == "Charset Customer"
+
+    def test_create_customer_form(self, client):
+        """Test that a form submission redirects, or returns JSON when the client asks for it."""
+        form = {"name": "Form Customer", "phone": "555-333-4444", "service_units": "12"}
+
+        response = client.post("/customers/create", data=form)
+        assert response.status_code == 302
+
+        response = client.post("/customers/create", data=form, headers={"Accept": "application/json, */*"})
+        assert response.status_code == 201
+        assert response.json["name"] == "Form Customer"
+        assert response.json["service_units"] == 12
+
     def test_view_customer(self, client, sample_customer):
         """Test viewing a specific customer."""
         response = client.get(f"/customers/{sample_customer.id}")
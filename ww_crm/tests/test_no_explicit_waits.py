@@ -16,29 +16,36 @@ This test ensures we maintain these benefits by checking for explicit wait patte
 """
 
 import os
-import re
+import shutil
+import subprocess
 import pytest
-from glob import glob
+
+from ww_crm.tools.check_explicit_waits import WAIT_PATTERNS, check_file
 
 # Mark all tests in this module as unit tests
 pytestmark = pytest.mark.unit
 
 
-# Patterns to detect explicit waits
-WAIT_PATTERNS = [
-    (r"\.wait_for_selector\(", "Explicit wait_for_selector call"),
-    (r"\.wait_for_timeout\(", "Arbitrary timeout"),
-    (r"\.wait_for_url\(", "Explicit URL wait"),
-    (r"\.wait_for_load_state\(", "Explicit load state wait"),
-    (r"expect_navigation\(.*wait_until\s*=", "Custom navigation wait_until"),
-    (r"page\.wait_for\(", "Generic wait_for call"),
-]
+def _walk_python_files(directory):
+    """Yield every .py file under a directory, skipping hidden entries like glob does.
 
-# Patterns for allowed exceptions
-ALLOWED_PATTERNS = [
-    # Example of an allowed exception:
-    r"# ALLOW_WAIT: .*",
-]
+    os.scandir's entries carry their file type, so no extra stat() is needed per entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_python_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
+def get_e2e_test_dir():
+    """Get the E2E test directory."""
+    # Get the project root directory
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(root_dir, "ww_crm", "tests", "e2e")
 
 
 def get_e2e_test_files():
@@ -47,12 +54,34 @@ def get_e2e_test_files():
     Returns:
         List of all E2E test files
     """
-    # Get the project root directory
-    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
     # Find all Python files in the e2e directory
-    pattern = os.path.join(root_dir, "ww_crm", "tests", "e2e", "**", "*.py")
-    return glob(pattern, recursive=True)
+    return list(_walk_python_files(get_e2e_test_dir()))
+
+
+def find_files_with_waits(directory):
+    """Pre-filter a directory with ripgrep (or grep) for files matching any wait pattern.
+
+    Python's re tries every alternative of WAIT_REGEX at each position, while ripgrep and
+    grep scan for the patterns' literal parts, so only the files they report need the
+    line-by-line Python pass.
+
+    Returns:
+        Set of normalized file paths, or None if neither tool is available or the search failed
+    """
+    patterns = [arg for pattern, _ in WAIT_PATTERNS for arg in ("-e", pattern)]
+    if shutil.which("rg"):
+        command = ["rg", "--files-with-matches", "--no-messages", "--glob", "*.py", *patterns, directory]
+    elif shutil.which("grep"):
+        command = ["grep", "--recursive", "--files-with-matches", "--extended-regexp", "--include=*.py"]
+        command += [*patterns, directory]
+    else:
+        return None
+
+    result = subprocess.run(command, capture_output=True, text=True)
+    # Both tools exit with 0 when something matched, 1 when nothing did and 2 on errors
+    if result.returncode not in (0, 1):
+        return None
+    return {os.path.normpath(path) for path in result.stdout.splitlines()}
 
 
 def test_no_explicit_waits_in_e2e_tests():
@@ -60,35 +89,20 @@ def test_no_explicit_waits_in_e2e_tests():
     test_files = get_e2e_test_files()
     assert test_files, "No E2E test files found"
 
+    # Only scan the files an external search flags, when one is available
+    files_with_waits = find_files_with_waits(get_e2e_test_dir())
+    if files_with_waits is not None:
+        test_files = [path for path in test_files if os.path.normpath(path) in files_with_waits]
+
     errors = []
 
     for file_path in test_files:
-        with open(file_path, "r") as f:
-            file_content = f.read()
-
         # Get relative path for more readable output
         rel_path = os.path.relpath(file_path)
 
-        # Check for explicit waits
-        for pattern, description in WAIT_PATTERNS:
-            # Find all matches
-            matches = re.finditer(pattern, file_content)
-
-            for match in matches:
-                # Check if this is an allowed exception
-                line_start = file_content.rfind("\n", 0, match.start()) + 1
-                line_end = file_content.find("\n", match.start())
-                line = file_content[line_start:line_end]
-
-                # Skip if the line has an allowed exception
-                if any(re.search(allowed, line) for allowed in ALLOWED_PATTERNS):
-                    continue
-
-                # Get line number (count newlines before match)
-                line_number = file_content.count("\n", 0, match.start()) + 1
-
-                # Add error
-                errors.append(f"{rel_path}:{line_number} - {description}: {line.strip()}")
+        for line_number, matches in sorted(check_file(file_path).items()):
+            for line, description in matches:
+                errors.append(f"{rel_path}:{line_number} - {description}: {line}")
 
     # If there are errors, display them and fail the test
     if errors:
@@ -1,10 +1,11 @@
 import pytest
 from datetime import datetime, timedelta
 from ww_crm.models import Customer, Invoice
+from ww_crm.services.invoice_service import InvoiceService
 from ww_crm.utils.constants import InvoiceStatus, BuildingType
 
-# Mark all tests in this module as unit tests
-pytestmark = pytest.mark.unit
+# Mark all tests in this module as unit tests; pytest-socket makes any network access fail fast
+pytestmark = [pytest.mark.unit, pytest.mark.disable_socket]
 
 
 def test_customer_model(db):
@@ -37,7 +38,7 @@ def test_customer_model(db):
     assert isinstance(retrieved.created_at, datetime)
 
 
-def test_invoice_model(db, sample_customer):
+def test_invoice_model(db, sample_customer, assert_max_queries):
     """Test that an invoice can be created and retrieved."""
     # Setup dates
     today = datetime.utcnow()
@@ -67,8 +68,9 @@ def test_invoice_model(db, sample_customer):
     assert retrieved.status == "sent"
     assert retrieved.service_description == "Window cleaning - 8 windows"
 
-    # Test relationship
-    assert retrieved.customer.name == sample_customer.name
+    # Test relationship; the customer is already in the session, so at most its row is reloaded
+    with assert_max_queries(1):
+        assert retrieved.customer.name == sample_customer.name
 
 
 def test_customer_invoice_relationship(db, sample_customer, sample_invoice):
@@ -87,8 +89,8 @@ def test_customer_invoice_relationship(db, sample_customer, sample_invoice):
     db.session.add(new_invoice)
     db.session.commit()
 
-    # Refresh sample_customer from the database
-    db.session.refresh(sample_customer)
+    # Only the invoices collection is stale; reload it on next access
+    db.session.expire(sample_customer, ["invoices"])
 
     # Check invoice count
     assert len(sample_customer.invoices) == 2
@@ -97,6 +99,18 @@ def test_customer_invoice_relationship(db, sample_customer, sample_invoice):
     assert any(inv.amount == 75.25 for inv in sample_customer.invoices)
 
 
+def test_invoice_list_loads_customers_in_one_query(db, seeded_db, assert_max_queries):
+    """Test that listing invoices doesn't lazy-load each invoice's customer separately."""
+    db.session.expire_all()
+
+    # One query for the invoices plus one for all of their customers, however many there are
+    with assert_max_queries(2):
+        invoices = InvoiceService.get_all_invoices()
+        customer_names = {invoice.customer.name for invoice in invoices}
+
+    assert customer_names == {customer.name for customer in seeded_db["customers"]}
+
+
 def test_customer_last_invoice_fields(db):
     """Test the denormalized last_invoice fields on the Customer model."""
     # Create a customer
@@ -106,7 +120,7 @@ def test_customer_last_invoice_fields(db):
         building_type=BuildingType.RESIDENTIAL
     )
     db.session.add(customer)
-    db.session.commit()
+    db.session.flush()  # Assigns customer.id without committing
     
     # Create an initial invoice
     first_invoice = Invoice(
@@ -117,7 +131,7 @@ def test_customer_last_invoice_fields(db):
         service_description="Initial service",
     )
     db.session.add(first_invoice)
-    db.session.commit()
+    db.session.flush()  # Assigns first_invoice.id
     
     # Manually update the last invoice fields (normally done by service layer)
     customer.last_invoice_date = first_invoice.service_date
@@ -141,7 +155,7 @@ def test_customer_last_invoice_fields(db):
         service_description="Follow-up service",
     )
     db.session.add(second_invoice)
-    db.session.commit()
+    db.session.flush()  # Assigns second_invoice.id
     
     # Update the last invoice fields again
     customer.last_invoice_date = second_invoice.service_date
@@ -162,45 +176,60 @@ def test_customer_last_invoice_fields(db):
     assert customer_dict["last_invoice_id"] == second_invoice.id
 
 
-def test_invoice_from_dict_method():
-    """Test the from_dict method for creating an Invoice from dictionary data."""
-    # Test with JSON data
-    json_data = {
-        'customer_id': 1,
-        'service_date': '2024-05-01T12:00:00',
-        'due_date': '2024-06-01T12:00:00',
-        'amount': 150.75,
-        'status': 'draft',
-        'service_description': 'Test service'
-    }
-
-    invoice = Invoice.from_dict(json_data, is_form=False)
-
-    assert invoice.customer_id == 1
-    assert invoice.service_date.isoformat() == '2024-05-01T12:00:00'
-    assert invoice.due_date.isoformat() == '2024-06-01T12:00:00'
-    assert invoice.amount == 150.75
-    assert invoice.status == 'draft'
-    assert invoice.service_description == 'Test service'
-
-    # Test with form data
-    form_data = {
-        'customer_id': 2,
-        'service_date': '2024-05-15',
-        'due_date': '2024-06-15',
-        'amount': '200.50',
-        'status': 'sent',
-        'service_description': 'Another test service'
-    }
-
-    invoice = Invoice.from_dict(form_data, is_form=True)
-
-    assert invoice.customer_id == 2
-    assert invoice.service_date.strftime('%Y-%m-%d') == '2024-05-15'
-    assert invoice.due_date.strftime('%Y-%m-%d') == '2024-06-15'
-    assert invoice.amount == 200.50
-    assert invoice.status == 'sent'
-    assert invoice.service_description == 'Another test service'
+@pytest.mark.parametrize(
+    "payload,is_form,expected",
+    [
+        (
+            {
+                'customer_id': 1,
+                'service_date': '2024-05-01T12:00:00',
+                'due_date': '2024-06-01T12:00:00',
+                'amount': 150.75,
+                'status': 'draft',
+                'service_description': 'Test service'
+            },
+            False,
+            {
+                'customer_id': 1,
+                'service_date': datetime(2024, 5, 1, 12),
+                'due_date': datetime(2024, 6, 1, 12),
+                'amount': 150.75,
+                'status': 'draft',
+                'service_description': 'Test service'
+            },
+        ),
+        (
+            {
+                'customer_id': 2,
+                'service_date': '2024-05-15',
+                'due_date': '2024-06-15',
+                'amount': '200.50',
+                'status': 'sent',
+                'service_description': 'Another test service'
+            },
+            True,
+            {
+                'customer_id': 2,
+                'service_date': datetime(2024, 5, 15),
+                'due_date': datetime(2024, 6, 15),
+                'amount': 200.50,
+                'status': 'sent',
+                'service_description': 'Another test service'
+            },
+        ),
+    ],
+    ids=["json", "form"],
+)
+def test_invoice_from_dict_method(payload, is_form, expected):
+    """Test the from_dict method for creating an Invoice from JSON or form data."""
+    invoice = Invoice.from_dict(payload, is_form=is_form)
+
+    assert invoice.customer_id == expected['customer_id']
+    assert invoice.service_date == expected['service_date']
+    assert invoice.due_date == expected['due_date']
+    assert invoice.amount == expected['amount']
+    assert invoice.status == expected['status']
+    assert invoice.service_description == expected['service_description']
 
 
 def test_invoice_to_dict_method(db, sample_invoice):
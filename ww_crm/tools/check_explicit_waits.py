@@ -18,6 +18,7 @@ import os
 import re
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple
 
 
@@ -27,7 +28,7 @@ WAIT_PATTERNS = [
     (r"\.wait_for_timeout\(", "Arbitrary timeout"),
     (r"\.wait_for_url\(", "Explicit URL wait"),
     (r"\.wait_for_load_state\(", "Explicit load state wait"),
-    (r"expect_navigation\(.*wait_until\s*=", "Custom navigation wait_until"),
+    (r"expect_navigation\(", "Deprecated expect_navigation; use expect(page).to_have_url"),
     (r"page\.wait_for\(", "Generic wait_for call"),
 ]
 
@@ -37,6 +38,15 @@ ALLOWED_PATTERNS = [
     r"# ALLOW_WAIT: .*",
 ]
 
+# All wait patterns as one alternation, so each text is scanned once; the named
+# group that matched ("p<index>") identifies the WAIT_PATTERNS entry
+WAIT_REGEX = re.compile("|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(WAIT_PATTERNS)))
+ALLOWED_REGEX = re.compile("|".join(ALLOWED_PATTERNS))
+
+# Every WAIT_PATTERNS entry contains one of these literals; text without any of them
+# can't match and skips the regex entirely
+FAST_NEEDLES = ("wait_for", "expect_navigation(")
+
 # Directories to scan
 TEST_DIRS = [
     "ww_crm/tests/e2e",
@@ -45,6 +55,9 @@ TEST_DIRS = [
 # File extensions to check
 FILE_EXTENSIONS = [".py"]
 
+# Below this many files, starting worker processes costs more than scanning serially
+PARALLEL_MIN_FILES = 200
+
 
 def find_test_files(base_dir: str = None) -> List[str]:
     """Find all test files to check.
@@ -87,20 +100,20 @@ def check_file(file_path: str) -> Dict[int, List[Tuple[str, str]]]:
     """
     results = {}
 
-    with open(file_path, "r") as f:
-        lines = f.readlines()
+    with open(file_path, "r", encoding="utf-8") as f:
+        for i, line in enumerate(f, 1):
+            # Most lines contain no wait at all; a substring check rules them out cheaply
+            if not any(needle in line for needle in FAST_NEEDLES):
+                continue
 
-    for i, line in enumerate(lines, 1):
-        # Check if line is allowed to have waits (has an exception comment)
-        if any(re.search(pattern, line) for pattern in ALLOWED_PATTERNS):
-            continue
+            # Check if line is allowed to have waits (has an exception comment)
+            if ALLOWED_REGEX.search(line):
+                continue
 
-        # Check each wait pattern
-        for pattern, description in WAIT_PATTERNS:
-            if re.search(pattern, line):
-                if i not in results:
-                    results[i] = []
-                results[i].append((line.strip(), description))
+            # Check all wait patterns in one pass over the line
+            for match in WAIT_REGEX.finditer(line):
+                description = WAIT_PATTERNS[int(match.lastgroup[1:])][1]
+                results.setdefault(i, []).append((line.strip(), description))
 
     return results
 
@@ -118,9 +131,14 @@ def main():
 
     found_waits = False
 
-    for file_path in files_to_check:
-        results = check_file(file_path)
+    # Large trees are scanned across processes; map() keeps the results in file order
+    if len(files_to_check) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            all_results = list(executor.map(check_file, files_to_check, chunksize=8))
+    else:
+        all_results = map(check_file, files_to_check)
 
+    for file_path, results in zip(files_to_check, all_results):
         if results:
             found_waits = True
             print(f"\n⚠️  Explicit waits found in {file_path}:")
@@ -2,20 +2,53 @@
 Response handling utilities for the Window Wash CRM application.
 """
 
-from flask import jsonify, render_template, request, redirect, url_for
+from flask import current_app, jsonify, render_template, request, redirect, url_for
+
+try:
+    import orjson  # Optional: faster JSON encoding for API responses
+except ImportError:
+    orjson = None
 
 
 def is_json_request():
     """
     Determine if the current request is expecting a JSON response.
+
+    The answer is cached on the request object, which lives exactly as long as
+    the request (unlike g, which test clients can share across requests).
     
     Returns:
         bool: True if the request expects JSON, False otherwise
     """
-    return (
-        request.headers.get("Accept") == "application/json" 
-        or request.content_type == "application/json"
-    )
+    cached = getattr(request, "_is_json_request", None)
+    if cached is None:
+        # text/html is listed first so "*/*" (and browsers' Accept headers) get HTML
+        cached = (
+            request.is_json
+            or request.accept_mimetypes.best_match(["text/html", "application/json"]) == "application/json"
+        )
+        request._is_json_request = cached
+    return cached
+
+
+def json_response(data, status_code=200):
+    """
+    Serialize data to a JSON response.
+
+    Uses orjson when it is installed, with keys sorted like jsonify's output;
+    otherwise falls back to jsonify.
+
+    Args:
+        data (dict or list): The data to serialize
+        status_code (int, optional): HTTP status code to return. Defaults to 200.
+
+    Returns:
+        tuple: The JSON response and status code
+    """
+    if orjson is None:
+        return jsonify(data), status_code
+    body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return current_app.response_class(body, mimetype="application/json"), status_code
 
 
 def render_response(template_name, json_data, status_code=200, **template_args):
@@ -23,7 +56,8 @@ def render_response(template_name, json_data, status_code=200, **template_args):
     Render a response based on the request content type.
     
     Args:
-        template_name (str): The template to render for HTML responses
+        template_name (str): The template to render for HTML responses, or None
+            for JSON-only endpoints, which always return JSON
         json_data (dict or list): The data to return for JSON responses
         status_code (int, optional): HTTP status code to return. Defaults to 200.
         **template_args: Additional arguments to pass to the template
@@ -31,8 +65,8 @@ def render_response(template_name, json_data, status_code=200, **template_args):
     Returns:
         Response: Either a JSON response or a rendered template
     """
-    if is_json_request():
-        return jsonify(json_data), status_code
+    if template_name is None or is_json_request():
+        return json_response(json_data, status_code)
     return render_template(template_name, **template_args), status_code
 
 
@@ -50,7 +84,7 @@ def created_response(entity, template_name=None, redirect_endpoint=None, **templ
         Response: Either a JSON response, a redirect, or a rendered template
     """
     if is_json_request():
-        return jsonify(entity), 201
+        return json_response(entity, 201)
     
     if redirect_endpoint:
         return redirect(url_for(redirect_endpoint))